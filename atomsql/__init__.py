@@ -1,5 +1,14 @@
 from .db import Database
 from .models import Model
-from .fields import IntegerField, StringField
+from .fields import BytesField, IntegerField, StringField
+from .parallel import map_partitions
 
-__all__ = ["Database", "Model", "IntegerField", "StringField", "Query"]
+__all__ = [
+    "Database",
+    "Model",
+    "IntegerField",
+    "StringField",
+    "BytesField",
+    "Query",
+    "map_partitions",
+]
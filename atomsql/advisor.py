@@ -0,0 +1,91 @@
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .db import Database
+    from .query import QuerySet
+
+# (table, equality filter columns, order_by column)
+QueryShape = Tuple[str, Tuple[str, ...], Optional[str]]
+
+
+class IndexSuggestion(NamedTuple):
+    table: str
+    columns: Tuple[str, ...]
+    frequency: int
+    estimated_rows: int
+    sql: str
+
+    @property
+    def score(self) -> int:
+        return self.frequency * self.estimated_rows
+
+
+class IndexAdvisor:
+    """
+    Collects the filter and ordering columns of executed QuerySets and
+    suggests indexes for the shapes the planner answers with a full scan.
+    """
+
+    def __init__(self, db: "Database"):
+        self.db = db
+        self.shapes: Counter = Counter()
+        self._samples: Dict[QueryShape, Tuple[str, list]] = {}
+
+    def observe(self, queryset: "QuerySet") -> None:
+        order_by = queryset._order_by.lstrip("-") if queryset._order_by else None
+        filters = tuple(sorted(queryset._filters))
+        if not filters and order_by is None:
+            return
+
+        shape = (queryset.model_cls._table_name, filters, order_by)
+        self.shapes[shape] += 1
+        if shape not in self._samples:
+            self._samples[shape] = queryset._build_sql()
+
+    def reset(self) -> None:
+        self.shapes.clear()
+        self._samples.clear()
+
+    def _table_rows(self, table: str) -> int:
+        estimate = self.db.table_row_estimate(table)
+        if estimate is not None:
+            return estimate
+        # Without planner statistics an exact count is the only honest figure.
+        cursor = self.db.backend.execute(f'SELECT COUNT(*) FROM "{table}"')
+        try:
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+    def suggestions(self) -> List[IndexSuggestion]:
+        """Returns index suggestions ranked by frequency x estimated rows."""
+        backend = self.db.backend
+        suggestions = []
+        for shape, frequency in self.shapes.items():
+            table, filters, order_by = shape
+            sql, params = self._samples[shape]
+            plan = backend.explain(sql, params)
+            if table not in backend.full_scans(plan):
+                continue
+
+            columns = filters
+            if order_by is not None and order_by not in filters:
+                columns += (order_by,)
+            name = "_".join(("idx", table) + columns)
+            column_list = ", ".join(f'"{column}"' for column in columns)
+            suggestions.append(
+                IndexSuggestion(
+                    table=table,
+                    columns=columns,
+                    frequency=frequency,
+                    estimated_rows=self._table_rows(table),
+                    sql=(
+                        f'CREATE INDEX IF NOT EXISTS "{name}" '
+                        f'ON "{table}" ({column_list})'
+                    ),
+                )
+            )
+
+        suggestions.sort(key=lambda s: (s.score, s.frequency), reverse=True)
+        return suggestions
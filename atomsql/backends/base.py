@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 
 class DatabaseBackend(ABC):
+    # Column usable for range partitioning when a table has no explicit key.
+    rowid_column: Optional[str] = None
+    # Native column types for the generic types returned by Field.get_sql_type.
+    data_types: Dict[str, str] = {}
+
     @property
     @abstractmethod
     def placeholder_char(self) -> str:
@@ -20,10 +25,86 @@ class DatabaseBackend(ABC):
     def execute(self, query: str, params: Optional[List] = None) -> List[Any]:
         raise NotImplementedError
 
+    @abstractmethod
+    def execute_many(self, query: str, params_seq: List[List[Any]]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def insert_many(
+        self,
+        table: str,
+        columns: List[str],
+        rows: List[List[Any]],
+        pk: str,
+        returning: bool = True,
+    ) -> Optional[List[Any]]:
+        """
+        Inserts ``rows`` and, if ``returning``, returns the primary key of each,
+        in order.
+        """
+        raise NotImplementedError
+
+    def primary_key_definition(self, sql_type: str) -> str:
+        return f"{sql_type} PRIMARY KEY"
+
+    def is_transient_error(self, exc: Exception) -> bool:
+        """Whether ``exc`` is a lock or serialization conflict worth retrying."""
+        return False
+
+    def execute_stream(self, query: str, params: Optional[List] = None) -> Any:
+        """
+        Executes a query on a dedicated cursor meant to be iterated lazily.
+        The caller is responsible for closing it.
+        """
+        return self.execute(query, params)
+
     @abstractmethod
     def commit(self) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def rollback(self) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def close(self) -> None:
         raise NotImplementedError
+
+    def estimate_table_rows(self, table_name: str) -> Optional[int]:
+        """Returns the planner's row estimate for a table, if one is available."""
+        return None
+
+    def estimate_query_rows(
+        self, query: str, params: Optional[List] = None
+    ) -> Optional[int]:
+        """Returns the planner's row estimate for a query, if one is available."""
+        return None
+
+    @abstractmethod
+    def iter_blob(
+        self, table: str, column: str, key: str, key_value: Any, chunk_size: int
+    ) -> Iterator[memoryview]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_blob(
+        self,
+        table: str,
+        column: str,
+        key: str,
+        key_value: Any,
+        chunks: Iterable[bytes],
+        size: int,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def explain(
+        self, query: str, params: Optional[List] = None, analyze: bool = False
+    ) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def full_scans(self, plan: Any) -> List[str]:
+        """Returns the tables a plan reads with a full sequential scan."""
+        raise NotImplementedError
@@ -1,4 +1,5 @@
-from typing import Any, List, Optional, TYPE_CHECKING
+import itertools
+from typing import Any, Iterable, Iterator, List, Optional, TYPE_CHECKING
 from .base import DatabaseBackend
 
 if TYPE_CHECKING:
@@ -6,16 +7,22 @@ if TYPE_CHECKING:
 
 
 class PostgresBackend(DatabaseBackend):
-    def __init__(self, db_path: str) -> None:
+    data_types = {"BLOB": "BYTEA"}
+    # Postgres rejects statements with more bind parameters than this.
+    max_parameters = 65535
+    _cursor_names = itertools.count()
+
+    def __init__(self, db_path: str, read_only: bool = False) -> None:
         self.db_path = db_path
+        self.read_only = read_only
         self.connection: Optional["psycopg.Connection"] = None
-        self.cursor: Optional["psycopg.Cursor"] = None
 
     def connect(self, **kwargs: Any) -> None:
         import psycopg
 
+        if self.read_only:
+            kwargs.setdefault("options", "-c default_transaction_read_only=on")
         self.connection = psycopg.connect(self.db_path, **kwargs)
-        self.cursor = self.connection.cursor()
 
     def disconnect(self) -> None:
         if self.connection:
@@ -24,12 +31,146 @@ class PostgresBackend(DatabaseBackend):
     def execute(self, query: str, params: Optional[List] = None) -> Any:
         if params is None:
             params = []
-        return self.cursor.execute(query, params)
+        # A fresh cursor per query keeps concurrently open result sets apart.
+        return self.connection.cursor().execute(query, params)
+
+    def execute_stream(self, query: str, params: Optional[List] = None) -> Any:
+        # Server-side cursors fetch rows in batches instead of buffering the
+        # full result on execute. WITH HOLD keeps them open across commits made
+        # while the result is still being iterated.
+        cursor = self.connection.cursor(
+            name=f"atomsql_{next(self._cursor_names)}", withhold=True
+        )
+        return cursor.execute(query, params or [])
+
+    def execute_many(self, query: str, params_seq: List[List[Any]]) -> None:
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(query, params_seq)
+        finally:
+            cursor.close()
+
+    def insert_many(
+        self,
+        table: str,
+        columns: List[str],
+        rows: List[List[Any]],
+        pk: str,
+        returning: bool = True,
+    ) -> Optional[List[Any]]:
+        if columns:
+            row_values = f"({', '.join('%s' for _ in columns)})"
+        else:
+            # DEFAULT VALUES inserts a single row; a DEFAULT key covers many.
+            columns, row_values = [pk], "(DEFAULT)"
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        chunk_size = self.max_parameters // max(len(columns), 1)
+        ids = []
+        with self.connection.cursor() as cursor:
+            for offset in range(0, len(rows), chunk_size):
+                chunk = rows[offset : offset + chunk_size]
+                values = ", ".join(row_values for _ in chunk)
+                sql = f'INSERT INTO "{table}" ({column_list}) VALUES {values}'
+                if returning:
+                    sql += f' RETURNING "{pk}"'
+                cursor.execute(sql, [value for row in chunk for value in row])
+                if returning:
+                    ids.extend(row[0] for row in cursor.fetchall())
+        return ids if returning else None
+
+    def primary_key_definition(self, sql_type: str) -> str:
+        if sql_type == "INTEGER":
+            return "INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY"
+        return f"{sql_type} PRIMARY KEY"
+
+    def is_transient_error(self, exc: Exception) -> bool:
+        # serialization_failure, deadlock_detected, lock_not_available
+        return getattr(exc, "sqlstate", None) in ("40001", "40P01", "55P03")
+
+    def estimate_table_rows(self, table_name: str) -> Optional[int]:
+        row = self.connection.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)",
+            [f'"{table_name}"'],
+        ).fetchone()
+        # reltuples is -1 for tables that have never been vacuumed or analyzed.
+        if row is None or row[0] < 0:
+            return None
+        return int(row[0])
+
+    def estimate_query_rows(
+        self, query: str, params: Optional[List] = None
+    ) -> Optional[int]:
+        row = self.connection.execute(
+            f"EXPLAIN (FORMAT JSON) {query}", params or []
+        ).fetchone()
+        return int(row[0][0]["Plan"]["Plan Rows"])
+
+    def iter_blob(
+        self, table: str, column: str, key: str, key_value: Any, chunk_size: int
+    ) -> Iterator[memoryview]:
+        sql = (
+            f'SELECT substring("{column}" FROM %s FOR %s) '
+            f'FROM "{table}" WHERE "{key}" = %s'
+        )
+        offset = 1
+        while True:
+            row = self.connection.execute(
+                sql, [offset, chunk_size, key_value]
+            ).fetchone()
+            if row is None and offset == 1:
+                raise LookupError(f"No row in '{table}' with {key}={key_value!r}")
+            if row is None or not row[0]:
+                return
+            yield memoryview(row[0])
+            if len(row[0]) < chunk_size:
+                return
+            offset += chunk_size
+
+    def write_blob(
+        self,
+        table: str,
+        column: str,
+        key: str,
+        key_value: Any,
+        chunks: Iterable[bytes],
+        size: int,
+    ) -> None:
+        # bytea has no incremental write; appending per chunk would rewrite the
+        # whole TOASTed value each time, so the value is written once.
+        data = b"".join(chunks)
+        if len(data) != size:
+            raise ValueError(f"Blob chunks total {len(data)} bytes, expected {size}")
+        self.connection.execute(
+            f'UPDATE "{table}" SET "{column}" = %s WHERE "{key}" = %s',
+            [data, key_value],
+        )
+
+    def explain(
+        self, query: str, params: Optional[List] = None, analyze: bool = False
+    ) -> dict:
+        options = "ANALYZE, FORMAT JSON" if analyze else "FORMAT JSON"
+        row = self.connection.execute(
+            f"EXPLAIN ({options}) {query}", params or []
+        ).fetchone()
+        return row[0][0]
+
+    def full_scans(self, plan: dict) -> List[str]:
+        node = plan.get("Plan", plan)
+        tables = []
+        if node.get("Node Type") == "Seq Scan":
+            tables.append(node["Relation Name"])
+        for child in node.get("Plans", []):
+            tables.extend(self.full_scans(child))
+        return tables
 
     def commit(self) -> None:
         if self.connection:
             self.connection.commit()
 
+    def rollback(self) -> None:
+        if self.connection:
+            self.connection.rollback()
+
     def close(self) -> None:
         self.disconnect()
 
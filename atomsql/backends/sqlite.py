@@ -1,13 +1,15 @@
 import sqlite3
-from typing import Any, List, Optional
+from typing import Any, Iterable, Iterator, List, Optional
 from .base import DatabaseBackend
 
 
 class SQLiteBackend(DatabaseBackend):
-    def __init__(self, db_path: str) -> None:
+    rowid_column = "rowid"
+
+    def __init__(self, db_path: str, read_only: bool = False) -> None:
         self.db_path = db_path
+        self.read_only = read_only
         self.connection = None
-        self.cursor = None
 
     @property
     def placeholder_char(self) -> str:
@@ -15,8 +17,10 @@ class SQLiteBackend(DatabaseBackend):
 
     def connect(self, **kwargs: Any) -> None:
         target = self.db_path if self.db_path else ":memory:"
+        if self.read_only:
+            target = f"file:{target}?mode=ro"
+            kwargs["uri"] = True
         self.connection = sqlite3.connect(target, **kwargs)
-        self.cursor = self.connection.cursor()
 
     def disconnect(self) -> None:
         self.connection.close()
@@ -24,10 +28,162 @@ class SQLiteBackend(DatabaseBackend):
     def execute(self, query: str, params: Optional[List] = None) -> Any:
         if params is None:
             params = []
-        return self.cursor.execute(query, params)
+        # A fresh cursor per query keeps concurrently open result sets apart.
+        return self.connection.cursor().execute(query, params)
+
+    def execute_many(self, query: str, params_seq: List[List[Any]]) -> None:
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(query, params_seq)
+        finally:
+            cursor.close()
+
+    def insert_many(
+        self,
+        table: str,
+        columns: List[str],
+        rows: List[List[Any]],
+        pk: str,
+        returning: bool = True,
+    ) -> Optional[List[Any]]:
+        if columns:
+            column_list = ", ".join(f'"{column}"' for column in columns)
+            placeholders = ", ".join("?" for _ in columns)
+            sql = f'INSERT INTO "{table}" ({column_list}) VALUES ({placeholders})'
+        else:
+            sql = f'INSERT INTO "{table}" DEFAULT VALUES'
+        if not returning:
+            self.execute_many(sql, rows)
+            return None
+        # Statements run in-process, so one per row costs no round trips and
+        # lastrowid gives each id without relying on RETURNING row order.
+        pk_index = columns.index(pk) if pk in columns else None
+        cursor = self.connection.cursor()
+        ids = []
+        for row in rows:
+            cursor.execute(sql, row)
+            ids.append(cursor.lastrowid if pk_index is None else row[pk_index])
+        cursor.close()
+        return ids
+
+    def is_transient_error(self, exc: Exception) -> bool:
+        message = str(exc)
+        return isinstance(exc, sqlite3.OperationalError) and (
+            "database is locked" in message or "database is busy" in message
+        )
+
+    def estimate_table_rows(self, table_name: str) -> Optional[int]:
+        # The leading integer of each stat is the number of rows an index (or,
+        # for idx IS NULL, the table) covers. Partial indexes cover fewer rows,
+        # so the largest value is the table's row count.
+        try:
+            row = self.connection.execute(
+                "SELECT MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 WHERE tbl = ?",
+                [table_name],
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # sqlite_stat1 only exists once ANALYZE has been run.
+            return None
+        return row[0]
+
+    def _resolve_rowid(self, table: str, key: str, key_value: Any) -> int:
+        if key == self.rowid_column:
+            return key_value
+        row = self.connection.execute(
+            f'SELECT rowid FROM "{table}" WHERE "{key}" = ?', [key_value]
+        ).fetchone()
+        if row is None:
+            raise LookupError(f"No row in '{table}' with {key}={key_value!r}")
+        return row[0]
+
+    def iter_blob(
+        self, table: str, column: str, key: str, key_value: Any, chunk_size: int
+    ) -> Iterator[memoryview]:
+        rowid = self._resolve_rowid(table, key, key_value)
+        row = self.connection.execute(
+            f'SELECT "{column}" IS NULL FROM "{table}" WHERE rowid = ?', [rowid]
+        ).fetchone()
+        if row is None:
+            raise LookupError(f"No row in '{table}' with {key}={key_value!r}")
+        if row[0]:
+            # blobopen cannot open NULL values; stream them as empty.
+            return
+        with self.connection.blobopen(table, column, rowid, readonly=True) as blob:
+            while chunk := blob.read(chunk_size):
+                yield memoryview(chunk)
+
+    def write_blob(
+        self,
+        table: str,
+        column: str,
+        key: str,
+        key_value: Any,
+        chunks: Iterable[bytes],
+        size: int,
+    ) -> None:
+        rowid = self._resolve_rowid(table, key, key_value)
+        # An explicit BEGIN keeps RELEASE from committing the caller's work.
+        began = not self.connection.in_transaction
+        if began:
+            self.connection.execute("BEGIN")
+        self.connection.execute("SAVEPOINT atomsql_write_blob")
+        try:
+            # Incremental blob handles cannot grow a value, so reserve it up front.
+            self.connection.execute(
+                f'UPDATE "{table}" SET "{column}" = zeroblob(?) WHERE rowid = ?',
+                [size, rowid],
+            )
+            written = 0
+            with self.connection.blobopen(table, column, rowid) as blob:
+                for chunk in chunks:
+                    written += len(chunk)
+                    if written > size:
+                        raise ValueError(
+                            f"Blob chunks exceed the declared {size} bytes"
+                        )
+                    blob.write(chunk)
+            if written != size:
+                raise ValueError(f"Blob chunks total {written} bytes, expected {size}")
+        except BaseException:
+            self.connection.execute("ROLLBACK TO atomsql_write_blob")
+            self.connection.execute("RELEASE atomsql_write_blob")
+            if began:
+                self.connection.rollback()
+            raise
+        self.connection.execute("RELEASE atomsql_write_blob")
+
+    def explain(
+        self, query: str, params: Optional[List] = None, analyze: bool = False
+    ) -> List[dict]:
+        if analyze:
+            raise NotImplementedError("SQLite cannot execute and time a query plan")
+        rows = self.connection.execute(
+            f"EXPLAIN QUERY PLAN {query}", params or []
+        ).fetchall()
+        nodes = {0: {"children": []}}
+        for node_id, parent, _, detail in rows:
+            node = {"id": node_id, "detail": detail, "children": []}
+            nodes[node_id] = node
+            nodes.get(parent, nodes[0])["children"].append(node)
+        return nodes[0]["children"]
+
+    def full_scans(self, plan: List[dict]) -> List[str]:
+        tables = []
+        for node in plan:
+            # Bounded lookups print as SEARCH. Every SCAN of a table reads all
+            # of it, even "USING (COVERING) INDEX", which only fixes the order.
+            words = node["detail"].split()
+            if words[0] == "SCAN" and words[1] not in ("CONSTANT", "SUBQUERY"):
+                # SQLite before 3.36 prints "SCAN TABLE t" rather than "SCAN t".
+                tables.append(words[2] if words[1] == "TABLE" else words[1])
+            tables.extend(self.full_scans(node["children"]))
+        return tables
 
     def commit(self) -> None:
         self.connection.commit()
 
+    def rollback(self) -> None:
+        self.connection.rollback()
+
     def close(self) -> None:
         self.connection.close()
@@ -1,17 +1,31 @@
+from contextlib import contextmanager
 from urllib.parse import urlparse
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
+import time
 from .backends.base import DatabaseBackend
 from .backends.sqlite import SQLiteBackend
 from .backends.postgres import PostgresBackend
 from .exceptions import ImproperlyConfigured
 from .models import ModelMeta
+from .advisor import IndexAdvisor
+from .identity import IdentityMap
+from .writer import BufferedWriter
 
 logger = logging.getLogger(__name__)
 
 
 class Database:
-    def __init__(self, connection_uri: str):
+    def __init__(
+        self, connection_uri: str, read_only: bool = False, stats_ttl: float = 60.0
+    ):
         self.uri = connection_uri
+        self.read_only = read_only
+        self.stats_ttl = stats_ttl
+        self._table_stats: Dict[str, Tuple[float, Optional[int]]] = {}
+        self.index_advisor: Optional[IndexAdvisor] = None
+        self.identity_map: Optional[IdentityMap] = None
+        self._writers: List[BufferedWriter] = []
         self.parsed_uri = urlparse(connection_uri)
         self.backend: DatabaseBackend = self._get_backend()
         self.backend.connect()
@@ -24,19 +38,30 @@ class Database:
                 path = self.parsed_uri.path
                 if path.startswith("/"):
                     path = path[1:]
-                return SQLiteBackend(path)
+                return SQLiteBackend(path, read_only=self.read_only)
             case "postgres" | "postgresql":
-                return PostgresBackend(self.uri)
+                return PostgresBackend(self.uri, read_only=self.read_only)
 
             case _:
                 raise ImproperlyConfigured(f"Unsupported database scheme:{scheme}")
 
+    @property
+    def in_memory(self) -> bool:
+        path = self.parsed_uri.path
+        return self.parsed_uri.scheme == "sqlite" and path in ("", "/", "/:memory:")
+
     def register(self, model_cls):
         table_name = f'"{model_cls._table_name}"'
         fields_definitions = []
 
         for name, field in model_cls._fields.items():
             field_type = field.get_sql_type()
+            field_type = self.backend.data_types.get(field_type, field_type)
+
+            if field.primary_key:
+                definition = self.backend.primary_key_definition(field_type)
+                fields_definitions.append(f'"{name}" {definition}')
+                continue
 
             constraints = []
             if not field.nullable:
@@ -63,13 +88,124 @@ class Database:
             self.register(model_cls)
             print(f"Registered model {model_cls.__name__}")
 
+    @contextmanager
+    def session(self):
+        """
+        Scopes an identity map to the block: rows loaded or saved inside it
+        are cached by primary key, so ``Model.get`` skips repeat queries.
+        """
+        previous = self.identity_map
+        self.identity_map = IdentityMap()
+        try:
+            yield self.identity_map
+        finally:
+            self.identity_map = previous
+
+    def enable_index_advisor(self) -> IndexAdvisor:
+        """Starts recording query shapes for index suggestions."""
+        if self.index_advisor is None:
+            self.index_advisor = IndexAdvisor(self)
+        return self.index_advisor
+
+    def table_row_estimate(self, table_name: str) -> Optional[int]:
+        """
+        Returns the cached row estimate for a table, refreshing it from the
+        backend once it is older than ``stats_ttl`` seconds.
+        """
+        now = time.monotonic()
+        cached = self._table_stats.get(table_name)
+        if cached is not None and now - cached[0] < self.stats_ttl:
+            return cached[1]
+
+        estimate = self.backend.estimate_table_rows(table_name)
+        self._table_stats[table_name] = (now, estimate)
+        return estimate
+
+    def _blob_target(self, model_cls, field_name: str, key: Optional[str]):
+        if field_name not in model_cls._fields:
+            raise ValueError(
+                f"Field '{field_name}' does not exist on model '{model_cls.__name__}'"
+            )
+        return model_cls._table_name, key or model_cls._pk
+
+    def read_blob(
+        self,
+        model_cls,
+        field_name: str,
+        key_value: Any,
+        key: Optional[str] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[memoryview]:
+        """
+        Streams a binary column in ``chunk_size`` pieces without loading the
+        whole value. Rows are located by primary key unless ``key`` names a
+        field.
+        """
+        table, key = self._blob_target(model_cls, field_name, key)
+        return self.backend.iter_blob(table, field_name, key, key_value, chunk_size)
+
+    def write_blob(
+        self,
+        model_cls,
+        field_name: str,
+        key_value: Any,
+        chunks: Iterable[bytes],
+        size: int,
+        key: Optional[str] = None,
+    ) -> None:
+        """
+        Overwrites a binary column from an iterable of chunks totalling ``size``
+        bytes, raising ``ValueError`` and leaving the row untouched otherwise.
+        SQLite writes incrementally; Postgres assembles the value and writes it
+        in one statement. Like ``Model.save``, the change is not committed.
+        """
+        table, key = self._blob_target(model_cls, field_name, key)
+        self.backend.write_blob(table, field_name, key, key_value, chunks, size)
+
     def execute(self, query: str, params=None):
         return self.backend.execute(query, params)
 
+    def buffered_writer(
+        self,
+        model_cls,
+        max_rows: int = 500,
+        max_latency_ms: float = 50,
+        max_queue: int = 10000,
+        on_error=None,
+        lock_retries: int = 3,
+    ) -> BufferedWriter:
+        """
+        Returns a write-behind buffer that batches inserts of ``model_cls`` on
+        a background thread. Pending rows are flushed when the database closes.
+        On SQLite, commit this connection's writes before the writer flushes,
+        or its batches will wait on the lock and may be rejected.
+        """
+        if self.in_memory:
+            raise ImproperlyConfigured(
+                "In-memory SQLite databases cannot be shared with a writer thread"
+            )
+        writer = BufferedWriter(
+            self,
+            model_cls,
+            max_rows=max_rows,
+            max_latency_ms=max_latency_ms,
+            max_queue=max_queue,
+            on_error=on_error,
+            lock_retries=lock_retries,
+        )
+        self._writers.append(writer)
+        return writer
+
     def commit(self):
         self.backend.commit()
 
+    def rollback(self):
+        self.backend.rollback()
+
     def close(self):
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
         self.backend.close()
 
     def query(self, model_cls):
@@ -4,3 +4,7 @@ class AtomSQLError(Exception):
 
 class ImproperlyConfigured(AtomSQLError):
     pass
+
+
+class ObjectDoesNotExist(AtomSQLError):
+    pass
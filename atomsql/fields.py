@@ -17,16 +17,23 @@ class BinaryExpression:
 
 class Field:
     def __init__(
-        self, default: Any = None, unique: bool = False, nullable: bool = True
+        self,
+        default: Any = None,
+        unique: bool = False,
+        nullable: bool = True,
+        primary_key: bool = False,
     ):
         if not isinstance(unique, bool):
             raise TypeError("Option 'unique' must be a boolean")
         if not isinstance(nullable, bool):
             raise TypeError("Option 'nullable' must be a boolean")
+        if not isinstance(primary_key, bool):
+            raise TypeError("Option 'primary_key' must be a boolean")
 
         self.default = default
         self.unique = unique
         self.nullable = nullable
+        self.primary_key = primary_key
         self.name = None
 
     def __set_name__(self, owner, name):
@@ -38,17 +45,25 @@ class Field:
         return instance.__dict__.get(self.name)
 
     def __set__(self, instance, value):
+        if self.primary_key and instance.__dict__.get("_persisted"):
+            raise ValueError(
+                f"Primary key '{self.name}' cannot be changed on a saved instance"
+            )
         if value is None:
             if not self.nullable:
                 raise ValueError(f"Field '{self.name}' cannot be None (nullable=False)")
             instance.__dict__[self.name] = None
-            return
-        self.validate_type(value)
-        instance.__dict__[self.name] = value
+        else:
+            self.validate_type(value)
+            instance.__dict__[self.name] = self.to_python(value)
+        instance.__dict__.setdefault("_dirty", set()).add(self.name)
 
     def validate_type(self, value):
         raise NotImplementedError
 
+    def to_python(self, value: Any) -> Any:
+        return value
+
     def get_sql_type(self) -> str:
         return "TEXT"
 
@@ -87,3 +102,22 @@ class StringField(Field):
 
     def get_sql_type(self) -> str:
         return "TEXT"
+
+
+class BytesField(Field):
+    def validate_type(self, value):
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            raise ValueError(
+                f"Field '{self.name}' expected a bytes-like object, got {type(value)}."
+            )
+
+    def to_python(self, value: Any) -> memoryview:
+        if isinstance(value, memoryview):
+            return value
+        if isinstance(value, bytearray):
+            # Detach from the caller's buffer so it stays resizable.
+            value = bytes(value)
+        return memoryview(value)
+
+    def get_sql_type(self) -> str:
+        return "BLOB"
@@ -0,0 +1,31 @@
+from typing import Any, Dict, Optional, Tuple, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import Model
+
+
+class IdentityMap:
+    """
+    Keeps at most one instance per (model, primary key) so repeated lookups
+    of the same row within a session return the already loaded object.
+    """
+
+    def __init__(self):
+        self._instances: Dict[Tuple[Type["Model"], Any], "Model"] = {}
+
+    def get(self, model_cls: Type["Model"], pk: Any) -> Optional["Model"]:
+        return self._instances.get((model_cls, pk))
+
+    def add(self, instance: "Model") -> "Model":
+        """Returns the mapped instance for the row, adding ``instance`` if new."""
+        key = (type(instance), instance.pk)
+        return self._instances.setdefault(key, instance)
+
+    def discard(self, instance: "Model") -> None:
+        self._instances.pop((type(instance), instance.pk), None)
+
+    def clear(self) -> None:
+        self._instances.clear()
+
+    def __len__(self) -> int:
+        return len(self._instances)
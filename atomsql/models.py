@@ -1,5 +1,7 @@
-from .fields import Field
+from .fields import Field, IntegerField
 from .query import QuerySet
+from .exceptions import ObjectDoesNotExist
+import itertools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,7 +15,21 @@ class ModelMeta(type):
         for key, value in list(attrs.items()):
             if isinstance(value, Field):
                 fields[key] = value
+
+        primary_keys = [key for key, field in fields.items() if field.primary_key]
+        if len(primary_keys) > 1:
+            raise TypeError(f"Model '{name}' declares more than one primary key")
+        if bases and not primary_keys:
+            if "id" in fields:
+                raise TypeError(f"Model '{name}' defines 'id' without primary_key=True")
+            pk_field = IntegerField(primary_key=True)
+            pk_field.__set_name__(None, "id")
+            attrs["id"] = pk_field
+            fields = {"id": pk_field, **fields}
+            primary_keys = ["id"]
+
         attrs["_fields"] = fields
+        attrs["_pk"] = primary_keys[0] if primary_keys else None
         attrs["_table_name"] = name.lower()
         new_class = super().__new__(cls, name, bases, attrs)
         new_class._db = None
@@ -34,17 +50,131 @@ class Model(metaclass=ModelMeta):
                 if callable(value):
                     value = value()
             setattr(self, name, value)
+        self.__dict__["_persisted"] = False
+
+    @property
+    def pk(self):
+        return getattr(self, self._pk)
+
+    @property
+    def dirty_fields(self) -> set:
+        """Fields assigned since the instance was loaded or last saved."""
+        return self.__dict__.get("_dirty", set()) - {self._pk}
+
+    def _mark_clean(self):
+        self.__dict__["_dirty"] = set()
+        self.__dict__["_persisted"] = True
 
     def save(self, db_interface):
-        table_name = f'"{self._table_name}"'
-        raw_columns = list(self._fields.keys())
-        values = [getattr(self, column) for column in raw_columns]
-        placeholders = [db_interface.backend.placeholder_char for _ in values]
+        if not self._persisted:
+            self.bulk_create([self], db_interface)
+            logger.info(f"Saved {self._table_name} with {self._pk}={self.pk}")
+            return
+
+        fields = sorted(self.dirty_fields)
+        if fields:
+            self.bulk_update([self], db_interface, fields)
+            logger.info(f"Updated {self._table_name} {self._pk}={self.pk}: {fields}")
+
+    @classmethod
+    def bulk_create(cls, instances, db_interface, return_ids=True):
+        """
+        Inserts ``instances`` and assigns each its primary key, using
+        ``RETURNING`` or ``lastrowid`` depending on the backend. With
+        ``return_ids=False`` keys are not fetched, which lets SQLite batch the
+        rows through ``executemany``.
+        """
+        instances = list(instances)
+        # Only integer keys can be generated by the database.
+        if not isinstance(cls._fields[cls._pk], IntegerField):
+            for instance in instances:
+                if instance.pk is None:
+                    raise ValueError(
+                        f"{cls.__name__} requires a value for primary key "
+                        f"'{cls._pk}'"
+                    )
+
+        # Rows without a key let the database assign one; the rest keep theirs.
+        # Consecutive runs of each kind go out in input order.
+        for missing_pk, run in itertools.groupby(
+            instances, key=lambda instance: instance.pk is None
+        ):
+            group = list(run)
+            columns = list(cls._fields.keys())
+            if missing_pk:
+                columns.remove(cls._pk)
+            rows = [[getattr(obj, column) for column in columns] for obj in group]
+            ids = db_interface.backend.insert_many(
+                cls._table_name, columns, rows, cls._pk, returning=return_ids
+            )
+            if not return_ids:
+                continue
+            for instance, pk in zip(group, ids):
+                instance.__dict__[cls._pk] = pk
+                instance._mark_clean()
+                if db_interface.identity_map is not None:
+                    db_interface.identity_map.add(instance)
 
-        sql = f"INSERT INTO {table_name} ({', '.join(raw_columns)}) VALUES ({', '.join(placeholders)})"
+        return instances
+
+    @classmethod
+    def bulk_update(cls, instances, db_interface, fields=None):
+        """
+        Writes changed columns of persisted ``instances`` back by primary key.
+        Instances sharing the same set of columns go out as one executemany
+        batch. Without ``fields``, each instance's dirty fields are used.
+        """
+        for field_name in fields or ():
+            if field_name not in cls._fields:
+                raise ValueError(
+                    f"Field '{field_name}' does not exist on model '{cls.__name__}'"
+                )
+
+        batches = {}
+        for instance in instances:
+            if instance.pk is None:
+                raise ValueError(
+                    f"Cannot update {cls.__name__} without a primary key value"
+                )
+            columns = instance.dirty_fields if fields is None else set(fields)
+            columns.discard(cls._pk)
+            if columns:
+                batches.setdefault(tuple(sorted(columns)), []).append(instance)
+
+        placeholder = db_interface.backend.placeholder_char
+        for columns, group in batches.items():
+            assignments = ", ".join(f'"{column}" = {placeholder}' for column in columns)
+            sql = (
+                f'UPDATE "{cls._table_name}" SET {assignments} '
+                f'WHERE "{cls._pk}" = {placeholder}'
+            )
+            db_interface.backend.execute_many(
+                sql,
+                [
+                    [getattr(instance, column) for column in columns] + [instance.pk]
+                    for instance in group
+                ],
+            )
+            for instance in group:
+                instance.__dict__["_dirty"] -= set(columns)
+
+        return instances
+
+    @classmethod
+    def get(cls, pk):
+        """
+        Fetches a row by primary key, consulting the database's identity map
+        first when a session is active.
+        """
+        db = cls.objects().db
+        if db.identity_map is not None:
+            instance = db.identity_map.get(cls, pk)
+            if instance is not None:
+                return instance
 
-        db_interface.execute(sql, values)
-        logger.info(f"Saved {self._table_name} with values: {values}")
+        for instance in cls.objects().filter(**{cls._pk: pk}).limit(1):
+            return instance
+        raise ObjectDoesNotExist(f"{cls.__name__} with {cls._pk}={pk!r} does not exist")
 
     @classmethod
     def objects(cls) -> QuerySet:
@@ -0,0 +1,65 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, TYPE_CHECKING
+import os
+
+from .exceptions import ImproperlyConfigured
+
+if TYPE_CHECKING:
+    from .query import QuerySet
+
+
+def _run_partition(uri: str, model_cls, state: dict, func: Callable) -> Any:
+    from .db import Database
+    from .query import QuerySet
+
+    db = Database(uri, read_only=True)
+    try:
+        model_cls._db = db
+        queryset = QuerySet(model_cls, db)
+        queryset.__dict__.update(state)
+        return func(queryset)
+    finally:
+        db.close()
+
+
+def map_partitions(
+    queryset: "QuerySet",
+    func: Callable[["QuerySet"], Any],
+    n: Optional[int] = None,
+    key: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> List[Any]:
+    """
+    Applies ``func`` to each partition of ``queryset`` in a process pool and
+    returns the results in partition order.
+
+    Every worker opens its own read-only connection from the database URI, so
+    ``func`` and the model class must be importable at module level.
+    """
+    db = queryset.db
+    if db.in_memory:
+        raise ImproperlyConfigured(
+            "In-memory SQLite databases cannot be shared across processes"
+        )
+
+    workers = max_workers or os.cpu_count() or 1
+    partitions = queryset.partitions(n or workers, key=key)
+    if not partitions:
+        return []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _run_partition,
+                db.uri,
+                partition.model_cls,
+                {
+                    "_filters": partition._filters,
+                    "_order_by": partition._order_by,
+                    "_key_range": partition._key_range,
+                },
+                func,
+            )
+            for partition in partitions
+        ]
+        return [future.result() for future in futures]
@@ -1,6 +1,8 @@
-from typing import Type, Any, TypeVar, TYPE_CHECKING, Iterable, Optional
+from typing import Type, Any, TypeVar, TYPE_CHECKING, Iterable, List, Optional, Tuple
 import functools
 
+from .fields import IntegerField
+
 if TYPE_CHECKING:
     from .models import Model
     from .db import Database
@@ -13,8 +15,11 @@ def aggregate_method(func):
     def wrapper(self: "QuerySet[T]", *args, **kwargs) -> Any:
         agg_expression = func(self, *args, **kwargs)
         sql, params = self._build_sql(select_expression=agg_expression)
-        cursor = self.db.backend.execute(sql, params)
-        result = cursor.fetchone()
+        cursor = self._execute(sql, params)
+        try:
+            result = cursor.fetchone()
+        finally:
+            cursor.close()
         return result[0] if result else None
 
     return wrapper
@@ -28,6 +33,17 @@ class QuerySet(Iterable[T]):
         self._order_by: Optional[str] = None
         self._limit: Optional[int] = None
         self._offset: Optional[int] = None
+        # (key, start, stop, include_nulls)
+        self._key_range: Optional[Tuple[str, int, int, bool]] = None
+
+    def _clone(self) -> "QuerySet[T]":
+        clone = QuerySet(self.model_cls, self.db)
+        clone._filters = dict(self._filters)
+        clone._order_by = self._order_by
+        clone._limit = self._limit
+        clone._offset = self._offset
+        clone._key_range = self._key_range
+        return clone
 
     def filter(self, **kwargs: Any) -> "QuerySet[T]":
         self._filters.update(kwargs)
@@ -45,8 +61,25 @@ class QuerySet(Iterable[T]):
         self._offset = offset
         return self
 
+    def count(self, approximate: bool = False) -> int:
+        """
+        Returns the number of matching rows. With ``approximate=True`` the
+        planner's estimate is used where the backend provides one, falling back
+        to an exact count otherwise.
+        """
+        if approximate:
+            unbounded = self._limit is None and self._offset is None
+            if not self._filters and self._key_range is None and unbounded:
+                estimate = self.db.table_row_estimate(self.model_cls._table_name)
+            else:
+                sql, params = self._build_sql(select_expression="1")
+                estimate = self.db.backend.estimate_query_rows(sql, params)
+            if estimate is not None:
+                return estimate
+        return self._exact_count()
+
     @aggregate_method
-    def count(self) -> str:
+    def _exact_count(self) -> str:
         return "COUNT(*)"
 
     @aggregate_method
@@ -65,6 +98,71 @@ class QuerySet(Iterable[T]):
             )
         return f'AVG("{field_name}")'
 
+    def partitions(self, n: int, key: Optional[str] = None) -> List["QuerySet[T]"]:
+        """
+        Splits the scan into at most ``n`` disjoint QuerySets over contiguous
+        ranges of ``key``. Defaults to the integer primary key, or the
+        backend's rowid column when the primary key is not an integer.
+        """
+        if n < 1:
+            raise ValueError("Number of partitions must be at least 1")
+        if self._limit is not None or self._offset is not None:
+            raise ValueError("Cannot partition a QuerySet with limit or offset")
+
+        if key is None:
+            key = self.model_cls._pk
+            if not isinstance(self.model_cls._fields[key], IntegerField):
+                key = self.db.backend.rowid_column
+            if key is None:
+                raise ValueError(
+                    "This backend has no implicit rowid; pass an integer 'key' field"
+                )
+        elif key not in self.model_cls._fields:
+            raise ValueError(
+                f"Field '{key}' does not exist on model '{self.model_cls.__name__}'"
+            )
+        elif not isinstance(self.model_cls._fields[key], IntegerField):
+            raise ValueError(f"Partition key '{key}' must be an IntegerField")
+
+        bounds = self._clone()
+        bounds._order_by = None
+        sql, params = bounds._build_sql(select_expression=f'MIN("{key}"), MAX("{key}")')
+        cursor = self.db.backend.execute(sql, params)
+        try:
+            low, high = cursor.fetchone()
+        finally:
+            cursor.close()
+        if low is None:
+            # Every matching key is NULL, or nothing matches at all.
+            probe = bounds._clone()
+            probe._key_range = (key, 0, 0, True)
+            return [probe] if probe._exists() else []
+
+        step = -(-(high - low + 1) // n)
+        partitions = []
+        for start in range(low, high + 1, step):
+            partition = self._clone()
+            # Rows with a NULL key fall in no range, so the first partition
+            # takes them to keep the partitions complete.
+            partition._key_range = (
+                key,
+                start,
+                min(start + step, high + 1),
+                start == low,
+            )
+            partitions.append(partition)
+        return partitions
+
+    def _exists(self) -> bool:
+        probe = self._clone()
+        probe._limit = 1
+        sql, params = probe._build_sql(select_expression="1")
+        cursor = self.db.backend.execute(sql, params)
+        try:
+            return cursor.fetchone() is not None
+        finally:
+            cursor.close()
+
     def _build_sql(self, select_expression: Optional[str] = None):
         table_name = f'"{self.model_cls._table_name}"'
 
@@ -76,13 +174,23 @@ class QuerySet(Iterable[T]):
         sql = f"SELECT {select_expression} FROM {table_name} "
 
         params = []
-
-        if self._filters:
+        conditions = []
+        placeholder = self.db.backend.placeholder_char
+
+        for key, value in self._filters.items():
+            conditions.append(f'"{key}" = {placeholder}')
+            params.append(value)
+
+        if self._key_range is not None:
+            key, start, stop, include_nulls = self._key_range
+            condition = f'"{key}" >= {placeholder} AND "{key}" < {placeholder}'
+            if include_nulls:
+                condition = f'({condition} OR "{key}" IS NULL)'
+            conditions.append(condition)
+            params.extend([start, stop])
+
+        if conditions:
             sql += " WHERE "
-            conditions = []
-            for key, value in self._filters.items():
-                conditions.append(f'"{key}" = {self.db.backend.placeholder_char}')
-                params.append(value)
             sql += " AND ".join(conditions)
 
         if self._order_by:
@@ -98,12 +206,36 @@ class QuerySet(Iterable[T]):
 
         return sql, params
 
+    def explain(self, analyze: bool = False) -> Any:
+        """
+        Returns the database's plan for this QuerySet: a tree of
+        ``EXPLAIN QUERY PLAN`` nodes on SQLite, the JSON plan on Postgres.
+        """
+        sql, params = self._build_sql()
+        return self.db.backend.explain(sql, params, analyze=analyze)
+
+    def _execute(self, sql: str, params: List[Any], stream: bool = False):
+        if self.db.index_advisor is not None:
+            self.db.index_advisor.observe(self)
+        if stream:
+            return self.db.backend.execute_stream(sql, params)
+        return self.db.backend.execute(sql, params)
+
     def __iter__(self):
         sql, params = self._build_sql()
-        cursor = self.db.backend.execute(sql, params)
-        while True:
-            row = cursor.fetchone()
-            if row is None:
-                break
-            data = dict(zip(self.model_cls._fields.keys(), row))
-            yield self.model_cls(**data)
+        # Bounded results are cheap to buffer; streaming cursors only pay off
+        # for open-ended scans.
+        bounded = self._limit is not None or self.model_cls._pk in self._filters
+        cursor = self._execute(sql, params, stream=not bounded)
+        # The finally clause also runs when an abandoned generator is
+        # garbage collected, so the cursor never outlives its iteration.
+        try:
+            for row in cursor:
+                data = dict(zip(self.model_cls._fields.keys(), row))
+                instance = self.model_cls(**data)
+                instance._mark_clean()
+                if self.db.identity_map is not None:
+                    instance = self.db.identity_map.add(instance)
+                yield instance
+        finally:
+            cursor.close()
@@ -0,0 +1,292 @@
+from typing import Callable, List, Optional, Type, TYPE_CHECKING
+import logging
+import queue
+import threading
+import time
+
+if TYPE_CHECKING:
+    from .db import Database
+    from .models import Model
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class BufferedWriter:
+    """
+    Queues model instances and inserts them from a background thread in
+    batches of up to ``max_rows``, each within a single transaction.
+
+    A batch is flushed once it is full or ``max_latency_ms`` after its first
+    row was picked up. ``save`` blocks while ``max_queue`` rows are pending.
+    The thread uses its own connection, opened from the database URI, and
+    does not fetch primary keys back onto the saved instances. On SQLite that
+    connection cannot write while another one holds an uncommitted write, so
+    callers must commit their own connection (``Model.save`` does not).
+    Batches hitting a lock are retried ``lock_retries`` times with backoff
+    and rejected as a whole if the lock persists.
+
+    If a batch fails, its rows are retried one by one so a bad row does not
+    take the rest down with it. Rows that still fail are passed to
+    ``on_error(instance, exc)``, or logged when no callback is given. If the
+    connection itself breaks, the thread reconnects; should that fail too, the
+    writer stops and ``save`` and ``flush`` raise the error.
+    """
+
+    def __init__(
+        self,
+        db: "Database",
+        model_cls: Type["Model"],
+        max_rows: int = 500,
+        max_latency_ms: float = 50,
+        max_queue: int = 10000,
+        on_error: Optional[Callable[["Model", Exception], None]] = None,
+        lock_retries: int = 3,
+    ):
+        if max_rows < 1:
+            raise ValueError("max_rows must be at least 1")
+
+        self.db = db
+        self.model_cls = model_cls
+        self.max_rows = max_rows
+        self.max_latency = max_latency_ms / 1000
+        self.on_error = on_error
+        self.lock_retries = lock_retries
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        # Serialises the closed check with the put so nothing lands after _STOP.
+        self._lock = threading.Lock()
+        self._closed = False
+        self._ready = threading.Event()
+        self._startup_error: Optional[BaseException] = None
+        self._fatal_error: Optional[BaseException] = None
+
+        self.rows_written = 0
+        self.rows_failed = 0
+        self.flushes = 0
+        self.errors = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"atomsql-writer-{model_cls._table_name}"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        self._ready.wait()
+        if self._startup_error is not None:
+            raise self._startup_error
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def metrics(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "rows_written": self.rows_written,
+            "rows_failed": self.rows_failed,
+            "flushes": self.flushes,
+            "errors": self.errors,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+        }
+
+    def save(self, instance: "Model", timeout: Optional[float] = None) -> None:
+        """
+        Queues ``instance`` for insertion. Blocks while the queue is full and
+        raises ``queue.Full`` if ``timeout`` seconds pass first.
+        """
+        if not isinstance(instance, self.model_cls):
+            raise TypeError(
+                f"Expected a {self.model_cls.__name__} instance, got {type(instance)}"
+            )
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise queue.Full
+        try:
+            self._raise_if_stopped()
+            if self._closed:
+                raise RuntimeError("Cannot save through a closed BufferedWriter")
+            while True:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Full
+                # Wake up periodically so a writer that dies while we wait for
+                # queue space cannot block the caller forever.
+                wait = 0.1 if remaining is None else min(remaining, 0.1)
+                try:
+                    self._queue.put(instance, timeout=wait)
+                    return
+                except queue.Full:
+                    self._raise_if_stopped()
+        finally:
+            self._lock.release()
+
+    def flush(self) -> None:
+        """Blocks until every queued instance has been written."""
+        self._raise_if_stopped()
+        self._queue.join()
+        self._raise_if_stopped()
+
+    def close(self) -> None:
+        """Writes all pending instances and stops the background thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            while self._thread.is_alive():
+                try:
+                    self._queue.put(_STOP, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+        self._thread.join()
+
+    def _raise_if_stopped(self) -> None:
+        if self._fatal_error is not None:
+            raise RuntimeError(
+                "BufferedWriter stopped after a fatal error"
+            ) from self._fatal_error
+
+    def _connect(self) -> "Database":
+        from .db import Database
+
+        return Database(self.db.uri)
+
+    def _run(self) -> None:
+        try:
+            connection = self._connect()
+        except BaseException as exc:
+            self._startup_error = exc
+            self._ready.set()
+            return
+        self._ready.set()
+
+        try:
+            stopping = False
+            while not stopping:
+                batch: List["Model"] = []
+                item = self._queue.get()
+                deadline = time.monotonic() + self.max_latency
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                        self._queue.task_done()
+                        break
+                    batch.append(item)
+                    remaining = deadline - time.monotonic()
+                    if len(batch) >= self.max_rows or remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                try:
+                    self._write(connection, batch)
+                except Exception:
+                    logger.exception("BufferedWriter connection failed; reconnecting")
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+                    connection = self._connect()
+        except BaseException as exc:
+            self._stop(exc)
+        finally:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def _stop(self, exc: BaseException) -> None:
+        """Records a fatal error and discards whatever is still queued."""
+        logger.error("BufferedWriter stopped after a fatal error", exc_info=exc)
+        self._fatal_error = exc
+        # Free queue space first so a save blocked in put can release the lock.
+        self._drain()
+        with self._lock:
+            self._closed = True
+            self._drain()
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                self.rows_failed += 1
+            self._queue.task_done()
+
+    def _write(self, connection: "Database", batch: List["Model"]) -> None:
+        if not batch:
+            return
+        started = time.perf_counter()
+        done = 0
+        try:
+            try:
+                self._insert_retrying(connection, batch)
+                self.rows_written += len(batch)
+                done = len(batch)
+                return
+            except Exception as exc:
+                self.errors += 1
+                connection.rollback()
+                if connection.backend.is_transient_error(exc):
+                    # Retrying row by row would only wait on the same lock.
+                    for instance in batch:
+                        self._reject(instance, exc)
+                        done += 1
+                    return
+            for instance in batch:
+                try:
+                    self._insert(connection, [instance])
+                    self.rows_written += 1
+                except Exception as exc:
+                    connection.rollback()
+                    self._reject(instance, exc)
+                done += 1
+        except Exception as exc:
+            # The connection is unusable; account for the rows not yet handled
+            # before the caller reconnects.
+            for instance in batch[done:]:
+                self._reject(instance, exc)
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.flushes += 1
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _insert_retrying(self, connection: "Database", batch: List["Model"]) -> None:
+        for attempt in range(self.lock_retries + 1):
+            try:
+                self._insert(connection, batch)
+                return
+            except Exception as exc:
+                transient = connection.backend.is_transient_error(exc)
+                if not transient or attempt == self.lock_retries:
+                    raise
+                connection.rollback()
+                time.sleep(0.05 * 2**attempt)
+
+    def _insert(self, connection: "Database", instances: List["Model"]) -> None:
+        self.model_cls.bulk_create(instances, connection, return_ids=False)
+        connection.commit()
+
+    def _reject(self, instance: "Model", exc: Exception) -> None:
+        self.rows_failed += 1
+        try:
+            if self.on_error is None:
+                logger.error(
+                    f"Dropped buffered {self.model_cls.__name__} row: {exc}",
+                    exc_info=exc,
+                )
+            else:
+                self.on_error(instance, exc)
+        except Exception:
+            logger.exception("BufferedWriter on_error callback failed")
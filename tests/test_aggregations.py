@@ -37,3 +37,40 @@ def test_avg(db):
 def test_invalid_field_aggregation(db):
     with pytest.raises(ValueError):
         Expense.objects().sum("non_existent_field")
+
+
+def test_approximate_count_unfiltered(db):
+    assert Expense.objects().count(approximate=True) == 3
+
+
+def test_approximate_count_uses_analyze_stats(db):
+    db.execute('CREATE INDEX "expense_category" ON "expense" ("category")')
+    db.execute(
+        'CREATE INDEX "expense_rent" ON "expense" ("amount") '
+        "WHERE \"category\" = 'Rent'"
+    )
+    db.execute("ANALYZE")
+    Expense(category="Travel", amount=200).save(db)
+    assert Expense.objects().count(approximate=True) == 3
+
+
+def test_approximate_count_without_stats_is_exact(db):
+    Expense(id=10**12, category="Travel", amount=200).save(db)
+    assert Expense.objects().count(approximate=True) == 4
+
+
+def test_approximate_count_is_cached(db):
+    db.execute("ANALYZE")
+    assert Expense.objects().count(approximate=True) == 3
+    Expense(category="Travel", amount=200).save(db)
+    assert Expense.objects().count(approximate=True) == 3
+
+    db.execute("ANALYZE")
+    assert Expense.objects().count(approximate=True) == 3
+
+    db.stats_ttl = 0
+    assert Expense.objects().count(approximate=True) == 4
+
+
+def test_approximate_count_filtered_falls_back_to_exact(db):
+    assert Expense.objects().filter(category="Food").count(approximate=True) == 2
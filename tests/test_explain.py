@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock
+
+import pytest
+from atomsql import Database, Model, StringField, IntegerField
+from atomsql.backends.postgres import PostgresBackend
+
+
+class Order(Model):
+    customer = StringField()
+    status = StringField()
+    total = IntegerField()
+
+
+@pytest.fixture
+def db():
+    database = Database("sqlite:///:memory:")
+    database.register(Order)
+    for i in range(20):
+        Order(customer=f"c{i % 4}", status="open", total=i).save(database)
+    database.commit()
+    return database
+
+
+def test_explain_full_scan(db):
+    plan = Order.objects().filter(customer="c1").explain()
+
+    assert plan[0]["detail"].startswith("SCAN")
+    assert db.backend.full_scans(plan) == ["order"]
+
+
+def test_explain_uses_index(db):
+    db.execute('CREATE INDEX "order_customer" ON "order" ("customer")')
+    plan = Order.objects().filter(customer="c1").explain()
+
+    assert "USING INDEX" in plan[0]["detail"]
+    assert db.backend.full_scans(plan) == []
+
+
+def test_advisor_ranks_suggestions(db):
+    advisor = db.enable_index_advisor()
+    for _ in range(3):
+        list(Order.objects().filter(customer="c1").order_by("-total"))
+    Order.objects().filter(status="open").count()
+    list(Order.objects())
+
+    suggestions = advisor.suggestions()
+
+    assert [s.columns for s in suggestions] == [("customer", "total"), ("status",)]
+    assert suggestions[0].frequency == 3
+    assert suggestions[0].estimated_rows == 20
+    assert suggestions[0].sql == (
+        'CREATE INDEX IF NOT EXISTS "idx_order_customer_total" '
+        'ON "order" ("customer", "total")'
+    )
+
+
+def test_advisor_skips_indexed_shapes(db):
+    advisor = db.enable_index_advisor()
+    db.execute('CREATE INDEX "order_status" ON "order" ("status")')
+    list(Order.objects().filter(status="open"))
+
+    assert advisor.suggestions() == []
+
+
+def test_full_scans_legacy_format(db):
+    plan = [
+        {"id": 2, "detail": "SCAN TABLE order", "children": []},
+        {"id": 3, "detail": "SCAN TABLE item USING COVERING INDEX i", "children": []},
+    ]
+    assert db.backend.full_scans(plan) == ["order", "item"]
+
+
+def test_index_ordered_scan_is_full_scan(db):
+    advisor = db.enable_index_advisor()
+    db.execute('CREATE INDEX "order_total" ON "order" ("total")')
+    query = Order.objects().filter(status="open").order_by("total")
+    plan = query.explain()
+    list(query)
+
+    assert "USING INDEX" in plan[0]["detail"]
+    assert db.backend.full_scans(plan) == ["order"]
+    assert [s.columns for s in advisor.suggestions()] == [("status", "total")]
+
+
+def test_postgres_full_scans():
+    plan = {
+        "Plan": {
+            "Node Type": "Nested Loop",
+            "Plans": [
+                {"Node Type": "Seq Scan", "Relation Name": "order"},
+                {
+                    "Node Type": "Hash",
+                    "Plans": [
+                        {"Node Type": "Index Scan", "Relation Name": "customer"},
+                        {"Node Type": "Seq Scan", "Relation Name": "item"},
+                    ],
+                },
+            ],
+        }
+    }
+    backend = PostgresBackend("postgresql://localhost/atomsql_test")
+
+    assert backend.full_scans(plan) == ["order", "item"]
+    assert backend.full_scans({"Plan": {"Node Type": "Index Scan"}}) == []
+
+
+def test_postgres_explain_unwraps_json_plan():
+    plan = {"Plan": {"Node Type": "Seq Scan", "Relation Name": "order"}}
+    backend = PostgresBackend("postgresql://localhost/atomsql_test")
+    backend.connection = MagicMock()
+    backend.connection.execute.return_value.fetchone.return_value = ([plan],)
+
+    assert backend.explain('SELECT * FROM "order"', analyze=True) == plan
+    sql = backend.connection.execute.call_args.args[0]
+    assert sql.startswith("EXPLAIN (ANALYZE, FORMAT JSON) SELECT")
+
+
+def test_explain_analyze_unsupported(db):
+    with pytest.raises(NotImplementedError):
+        Order.objects().explain(analyze=True)
@@ -1,6 +1,6 @@
 # tests/test_fields.py
 import pytest
-from atomsql import Model, IntegerField, StringField
+from atomsql import Model, BytesField, IntegerField, StringField
 
 
 class User(Model):
@@ -24,3 +24,70 @@ def test_required_fields():
     # Test missing non-nullable field
     with pytest.raises(ValueError):
         User(age=20)  # Missing 'name'
+
+
+class Attachment(Model):
+    name = StringField()
+    payload = BytesField()
+
+
+def test_bytes_field_validation():
+    a = Attachment(name="a", payload=b"abc")
+    assert isinstance(a.payload, memoryview)
+    assert a.payload == b"abc"
+
+    a.payload = bytearray(b"xyz")
+    assert bytes(a.payload) == b"xyz"
+
+    with pytest.raises(ValueError):
+        a.payload = "not bytes"
+
+
+def test_bytes_field_roundtrip(db):
+    db.register(Attachment)
+    Attachment(name="a", payload=b"\x00\x01\x02").save(db)
+
+    (loaded,) = list(Attachment.objects())
+    assert isinstance(loaded.payload, memoryview)
+    assert loaded.payload.tobytes() == b"\x00\x01\x02"
+
+
+def test_bytes_field_streaming(db):
+    db.register(Attachment)
+    Attachment(name="big", payload=b"").save(db)
+    data = bytes(range(256)) * 40
+
+    chunks = (data[i : i + 1000] for i in range(0, len(data), 1000))
+    db.write_blob(Attachment, "payload", "big", chunks, size=len(data), key="name")
+
+    read = list(db.read_blob(Attachment, "payload", 1, chunk_size=4096))
+    assert [len(chunk) for chunk in read] == [4096, 4096, 2048]
+    assert b"".join(read) == data
+
+
+def test_bytes_field_streaming_checks_size(db):
+    db.register(Attachment)
+    Attachment(name="a", payload=b"abc").save(db)
+    db.commit()
+
+    with pytest.raises(ValueError):
+        db.write_blob(Attachment, "payload", 1, [b"ab", b"cd"], size=3)
+    with pytest.raises(ValueError):
+        db.write_blob(Attachment, "payload", 1, [b"ab"], size=3)
+
+    assert b"".join(db.read_blob(Attachment, "payload", 1)) == b"abc"
+    assert not db.backend.connection.in_transaction
+
+
+def test_bytes_field_streaming_null(db):
+    db.register(Attachment)
+    Attachment(name="empty").save(db)
+
+    assert list(db.read_blob(Attachment, "payload", 1)) == []
+
+
+def test_bytes_field_streaming_missing_row(db):
+    db.register(Attachment)
+
+    with pytest.raises(LookupError):
+        list(db.read_blob(Attachment, "payload", 1))
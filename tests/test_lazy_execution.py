@@ -122,3 +122,40 @@ def test_model_not_registered_error():
 
     with pytest.raises(RuntimeError, match="not registered"):
         UnregisteredModel.all()
+
+
+def test_interleaved_iteration(db, sample_data):
+    """
+    Two open iterators and an aggregate must not share a result set.
+    """
+    outer = iter(Product.objects().order_by("price"))
+    first = next(outer)
+
+    inner = [p.name for p in Product.objects().filter(category="Electronics")]
+    assert Product.objects().count() == 3
+
+    rest = [p.name for p in outer]
+    assert first.name == "Coffee Mug"
+    assert rest == ["Smartphone", "Laptop"]
+    assert sorted(inner) == ["Laptop", "Smartphone"]
+
+
+def test_cursor_closed_when_generator_discarded(db, sample_data):
+    """
+    Abandoning a partially consumed iterator closes its cursor.
+    """
+    opened = []
+    execute_stream = db.backend.execute_stream
+
+    def tracking_execute(*args):
+        cursor = execute_stream(*args)
+        opened.append(cursor)
+        return cursor
+
+    with patch.object(db.backend, "execute_stream", side_effect=tracking_execute):
+        iterator = iter(Product.objects())
+        next(iterator)
+        del iterator
+
+    with pytest.raises(Exception, match="closed cursor"):
+        opened[0].fetchone()
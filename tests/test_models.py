@@ -1,5 +1,9 @@
 # tests/test_models.py
+from unittest.mock import patch
+
+import pytest
 from atomsql import Model, StringField
+from atomsql.exceptions import ObjectDoesNotExist
 
 
 class Product(Model):
@@ -16,3 +20,143 @@ def test_model_init_defaults():
     # Assuming you implemented the default logic from our previous step
     # This tests that defaults are applied correctly on __init__
     pass
+
+
+class Tag(Model):
+    label = StringField(primary_key=True)
+
+
+def test_implicit_primary_key():
+    assert Product._pk == "id"
+    assert list(Product._fields) == ["id", "sku"]
+    assert Tag._pk == "label"
+    assert "id" not in Tag._fields
+
+
+def test_save_populates_primary_key(db):
+    db.register(Product)
+    first = Product(sku="A-1")
+    second = Product(sku="B-2")
+    first.save(db)
+    second.save(db)
+
+    assert (first.pk, second.pk) == (1, 2)
+    assert Product.get(2).sku == "B-2"
+
+
+def test_bulk_create_populates_primary_keys(db):
+    db.register(Product)
+    products = Product.bulk_create(
+        [Product(sku="A"), Product(id=10, sku="B"), Product(sku="C")], db
+    )
+
+    assert [p.pk for p in products] == [1, 10, 11]
+
+
+def test_bulk_create_requires_non_integer_keys(db):
+    db.register(Tag)
+
+    with pytest.raises(ValueError, match="primary key 'label'"):
+        Tag(label=None).save(db)
+    assert db.execute('SELECT COUNT(*) FROM "tag"').fetchone()[0] == 0
+
+
+def test_get_uses_buffered_cursor(db):
+    db.register(Product)
+    Product(sku="A").save(db)
+
+    with patch.object(db.backend, "execute_stream") as execute_stream:
+        assert Product.get(1).sku == "A"
+    execute_stream.assert_not_called()
+
+
+def test_get_missing_row(db):
+    db.register(Product)
+    with pytest.raises(ObjectDoesNotExist):
+        Product.get(42)
+
+
+def test_identity_map_skips_repeat_lookups(db):
+    db.register(Product)
+    Product(sku="A").save(db)
+
+    with db.session() as identity_map:
+        first = Product.get(1)
+        with patch.object(db.backend, "execute") as execute:
+            assert Product.get(1) is first
+            execute.assert_not_called()
+        assert len(identity_map) == 1
+
+    assert db.identity_map is None
+    assert Product.get(1) is not first
+
+
+def test_save_updates_only_dirty_fields(db):
+    db.register(Product)
+    Product(sku="A").save(db)
+    (product,) = list(Product.objects())
+    assert product.dirty_fields == set()
+
+    with patch.object(db.backend, "execute_many") as execute_many:
+        product.save(db)
+        execute_many.assert_not_called()
+
+    product.sku = "B"
+    with patch.object(
+        db.backend, "execute_many", wraps=db.backend.execute_many
+    ) as execute_many:
+        product.save(db)
+    execute_many.assert_called_once_with(
+        'UPDATE "product" SET "sku" = ? WHERE "id" = ?', [["B", 1]]
+    )
+    assert product.dirty_fields == set()
+    assert Product.get(1).sku == "B"
+
+
+def test_bulk_update_groups_by_shape(db):
+    class Item(Model):
+        name = StringField()
+        colour = StringField()
+
+    db.register(Item)
+    items = Item.bulk_create([Item(name=str(i), colour="red") for i in range(3)], db)
+    items[0].colour = "blue"
+    items[1].colour = "green"
+    items[2].name = "renamed"
+
+    with patch.object(
+        db.backend, "execute_many", wraps=db.backend.execute_many
+    ) as execute_many:
+        Item.bulk_update(items, db)
+
+    assert execute_many.call_count == 2
+    rows = db.execute('SELECT "name", "colour" FROM "item" ORDER BY "id"').fetchall()
+    assert rows == [("0", "blue"), ("1", "green"), ("renamed", "red")]
+
+
+def test_save_model_without_columns(db):
+    class Marker(Model):
+        pass
+
+    db.register(Marker)
+    markers = Marker.bulk_create([Marker(), Marker()], db)
+
+    assert [m.pk for m in markers] == [1, 2]
+
+
+def test_primary_key_is_immutable_once_saved(db):
+    db.register(Product)
+    Product.bulk_create([Product(sku="A"), Product(sku="B")], db)
+    product = Product.get(1)
+
+    with pytest.raises(ValueError, match="Primary key"):
+        product.id = 2
+    assert Product.get(2).sku == "B"
+
+
+def test_bulk_update_rejects_unknown_fields(db):
+    db.register(Product)
+    products = Product.bulk_create([Product(sku="A")], db)
+
+    with pytest.raises(ValueError, match="does not exist"):
+        Product.bulk_update(products, db, fields=["missing"])
@@ -0,0 +1,87 @@
+import pytest
+from atomsql import Database, Model, StringField, IntegerField, map_partitions
+from atomsql.exceptions import ImproperlyConfigured
+
+
+class Reading(Model):
+    sensor = StringField()
+    value = IntegerField()
+
+
+def sum_values(queryset):
+    return sum(reading.value for reading in queryset)
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    database = Database(f"sqlite:///{tmp_path / 'readings.db'}")
+    database.register(Reading)
+    for i in range(100):
+        Reading(sensor="a" if i % 2 else "b", value=i).save(database)
+    database.commit()
+    yield database
+    database.close()
+
+
+def test_partitions_are_disjoint_and_complete(file_db):
+    partitions = Reading.objects().partitions(4)
+
+    assert len(partitions) == 4
+    values = [reading.value for part in partitions for reading in part]
+    assert sorted(values) == list(range(100))
+
+
+def test_partitions_respect_filters(file_db):
+    partitions = Reading.objects().filter(sensor="a").partitions(3)
+
+    assert sum(part.count() for part in partitions) == 50
+
+
+def test_partitions_on_declared_key(file_db):
+    partitions = Reading.objects().partitions(5, key="value")
+    sql, params = partitions[0]._build_sql()
+
+    assert '"value" >= ?' in sql
+    assert params == [0, 20]
+
+
+def test_partitions_empty_table(db):
+    db.register(Reading)
+    assert Reading.objects().partitions(4) == []
+
+
+def test_partitions_reject_limit(file_db):
+    with pytest.raises(ValueError):
+        Reading.objects().limit(10).partitions(2)
+
+
+def test_map_partitions(file_db):
+    results = map_partitions(Reading.objects(), sum_values, n=4, max_workers=2)
+
+    assert len(results) == 4
+    assert sum(results) == sum(range(100))
+
+
+def test_map_partitions_rejects_memory_db(db):
+    db.register(Reading)
+    with pytest.raises(ImproperlyConfigured):
+        map_partitions(Reading.objects(), sum_values)
+
+
+def test_partitions_reject_non_integer_key(file_db):
+    with pytest.raises(ValueError, match="IntegerField"):
+        Reading.objects().partitions(2, key="sensor")
+
+
+def test_partitions_include_null_keys(file_db):
+    for _ in range(4):
+        Reading(sensor="c", value=None).save(file_db)
+    file_db.commit()
+
+    partitions = Reading.objects().filter(sensor="c").partitions(3, key="value")
+    assert len(partitions) == 1
+    assert partitions[0].count() == 4
+
+    partitions = Reading.objects().partitions(3, key="value")
+    assert sum(part.count() for part in partitions) == 104
+    assert [part.filter(sensor="c").count() for part in partitions] == [4, 0, 0]
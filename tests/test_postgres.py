@@ -37,8 +37,7 @@ def test_postgres_integration():
         print("✅ Data saved")
 
         # 5. Verify (SELECT)
-        db.backend.cursor.execute('SELECT "name", "age" FROM "user"')
-        row = db.backend.cursor.fetchone()
+        row = db.execute('SELECT "name", "age" FROM "user"').fetchone()
 
         assert row is not None
         assert row[0] == "Alice"
@@ -35,6 +35,29 @@ class TestPostgresLazyImport(unittest.TestCase):
             # Check if connect was called on the mock
             mock_psycopg.connect.assert_called_once()
 
+    def test_insert_many_respects_parameter_limit(self):
+        """Test that large inserts are split below the bind parameter limit"""
+        backend = PostgresBackend(db_path="postgresql://localhost/atomsql_test")
+        backend.connection = MagicMock()
+        cursor = backend.connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.side_effect = [[(1,)] * 10, [(2,)] * 10, [(3,)] * 5]
+
+        backend.max_parameters = 20
+        ids = backend.insert_many("user", ["name", "age"], [["a", 1]] * 25, "id")
+
+        batches = [call.args[1] for call in cursor.execute.call_args_list]
+        self.assertEqual([len(params) for params in batches], [20, 20, 10])
+        self.assertEqual(ids, [1] * 10 + [2] * 10 + [3] * 5)
+
+    def test_iter_blob_missing_row(self):
+        """Test that streaming a missing row raises like the SQLite backend"""
+        backend = PostgresBackend(db_path="postgresql://localhost/atomsql_test")
+        backend.connection = MagicMock()
+        backend.connection.execute.return_value.fetchone.return_value = None
+
+        with self.assertRaises(LookupError):
+            list(backend.iter_blob("attachment", "payload", "id", 1, 1024))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,240 @@
+import queue
+import sqlite3
+import threading
+from unittest.mock import patch
+
+import pytest
+from atomsql import Database, Model, StringField, IntegerField
+from atomsql.backends.sqlite import SQLiteBackend
+from atomsql.exceptions import ImproperlyConfigured
+
+
+class Event(Model):
+    kind = StringField()
+    value = IntegerField()
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    database = Database(f"sqlite:///{tmp_path / 'events.db'}")
+    database.register(Event)
+    yield database
+    database.close()
+
+
+def stored_count(db):
+    return db.execute('SELECT COUNT(*) FROM "event"').fetchone()[0]
+
+
+def test_writer_batches_rows(file_db):
+    writer = file_db.buffered_writer(Event, max_rows=10, max_latency_ms=100)
+    events = [Event(kind="click", value=i) for i in range(25)]
+    for event in events:
+        writer.save(event)
+    writer.flush()
+
+    assert stored_count(file_db) == 25
+    assert writer.metrics["rows_written"] == 25
+    assert writer.metrics["flushes"] == 3
+    assert writer.metrics["queue_depth"] == 0
+
+
+def test_writer_flushes_after_latency(file_db):
+    writer = file_db.buffered_writer(Event, max_rows=1000, max_latency_ms=10)
+    writer.save(Event(kind="view", value=1))
+    writer.flush()
+
+    assert stored_count(file_db) == 1
+    assert writer.flushes == 1
+
+
+def test_close_flushes_pending_rows(tmp_path):
+    path = tmp_path / "events.db"
+    db = Database(f"sqlite:///{path}")
+    db.register(Event)
+    writer = db.buffered_writer(Event, max_rows=1000, max_latency_ms=60000)
+    for i in range(5):
+        writer.save(Event(kind="click", value=i))
+    db.close()
+
+    reader = Database(f"sqlite:///{path}")
+    assert stored_count(reader) == 5
+    reader.close()
+    with pytest.raises(RuntimeError):
+        writer.save(Event(kind="click", value=6))
+
+
+def test_backpressure(file_db):
+    gate = threading.Event()
+    bulk_create = Event.bulk_create.__func__
+
+    def blocked_bulk_create(cls, instances, db_interface, **kwargs):
+        gate.wait()
+        return bulk_create(cls, instances, db_interface, **kwargs)
+
+    writer = file_db.buffered_writer(Event, max_rows=1, max_queue=1)
+    with patch.object(Event, "bulk_create", classmethod(blocked_bulk_create)):
+        writer.save(Event(kind="click", value=1))
+        writer.save(Event(kind="click", value=2))
+        with pytest.raises(queue.Full):
+            writer.save(Event(kind="click", value=3), timeout=0.05)
+        assert writer.queue_depth == 1
+
+        gate.set()
+        writer.flush()
+
+    assert stored_count(file_db) == 2
+
+
+def test_writer_rejects_memory_db(db):
+    db.register(Event)
+    with pytest.raises(ImproperlyConfigured):
+        db.buffered_writer(Event)
+
+
+def test_writer_batches_with_executemany(file_db):
+    writer = file_db.buffered_writer(Event, max_rows=10, max_latency_ms=10)
+    with patch(
+        "atomsql.backends.sqlite.SQLiteBackend.execute_many", autospec=True
+    ) as execute_many:
+        for i in range(10):
+            writer.save(Event(kind="click", value=i))
+        writer.flush()
+
+    execute_many.assert_called_once()
+    assert len(execute_many.call_args.args[2]) == 10
+
+
+def test_failed_batch_keeps_good_rows(tmp_path):
+    class Strict(Model):
+        code = StringField(unique=True)
+
+    db = Database(f"sqlite:///{tmp_path / 'strict.db'}")
+    db.register(Strict)
+    rejected = []
+    writer = db.buffered_writer(
+        Strict,
+        max_rows=3,
+        max_latency_ms=1000,
+        on_error=lambda instance, exc: rejected.append(instance.code),
+    )
+    for code in ("a", "b", "a"):
+        writer.save(Strict(code=code))
+    writer.flush()
+
+    assert rejected == ["a"]
+    assert writer.metrics["rows_written"] == 2
+    assert writer.metrics["rows_failed"] == 1
+    db.close()
+
+
+def test_save_racing_close_is_rejected(file_db):
+    writer = file_db.buffered_writer(Event, max_latency_ms=1)
+    errors = []
+
+    def producer():
+        for i in range(200):
+            try:
+                writer.save(Event(kind="click", value=i))
+            except RuntimeError:
+                errors.append(i)
+                return
+
+    threads = [threading.Thread(target=producer) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    writer.close()
+    for thread in threads:
+        thread.join()
+
+    writer.flush()
+    assert stored_count(file_db) == writer.rows_written
+    assert writer.queue_depth == 0
+
+
+def test_writer_survives_connection_errors(file_db):
+    writer = file_db.buffered_writer(Event, max_rows=5, max_latency_ms=10)
+    broken = patch(
+        "atomsql.backends.sqlite.SQLiteBackend.execute_many",
+        side_effect=sqlite3.OperationalError("disk I/O error"),
+    )
+    broken_rollback = patch(
+        "atomsql.backends.sqlite.SQLiteBackend.rollback",
+        side_effect=sqlite3.OperationalError("disk I/O error"),
+    )
+    with broken, broken_rollback:
+        for i in range(5):
+            writer.save(Event(kind="click", value=i))
+        writer.flush()
+
+    assert writer._thread.is_alive()
+    assert writer.rows_failed == 5
+
+    writer.save(Event(kind="click", value=5))
+    writer.flush()
+    assert stored_count(file_db) == 1
+
+
+def test_writer_reports_fatal_errors(file_db):
+    writer = file_db.buffered_writer(Event, max_rows=1, max_queue=2)
+    broken = patch(
+        "atomsql.backends.sqlite.SQLiteBackend.execute_many",
+        side_effect=sqlite3.OperationalError("disk I/O error"),
+    )
+    broken_rollback = patch(
+        "atomsql.backends.sqlite.SQLiteBackend.rollback",
+        side_effect=sqlite3.OperationalError("disk I/O error"),
+    )
+    no_reconnect = patch.object(
+        writer, "_connect", side_effect=sqlite3.OperationalError("unable to open")
+    )
+    with broken, broken_rollback, no_reconnect:
+        writer.save(Event(kind="click", value=1))
+        writer._thread.join(timeout=5)
+
+    assert not writer._thread.is_alive()
+    with pytest.raises(RuntimeError, match="fatal error"):
+        writer.save(Event(kind="click", value=2))
+    with pytest.raises(RuntimeError, match="fatal error"):
+        writer.flush()
+    writer.close()
+
+
+def test_writer_retries_locked_batches(file_db):
+    writer = file_db.buffered_writer(Event, max_rows=3, max_latency_ms=10)
+    execute_many = SQLiteBackend.execute_many
+    failures = iter([sqlite3.OperationalError("database is locked")] * 2)
+
+    def locked_execute_many(self, query, params_seq):
+        exc = next(failures, None)
+        if exc is not None:
+            raise exc
+        return execute_many(self, query, params_seq)
+
+    with patch.object(SQLiteBackend, "execute_many", locked_execute_many):
+        for i in range(3):
+            writer.save(Event(kind="click", value=i))
+        writer.flush()
+
+    assert stored_count(file_db) == 3
+    assert writer.rows_failed == 0
+
+
+def test_writer_rejects_batch_after_lock_retries(file_db):
+    writer = file_db.buffered_writer(
+        Event, max_rows=3, max_latency_ms=10, lock_retries=1
+    )
+    locked = patch.object(
+        SQLiteBackend,
+        "execute_many",
+        side_effect=sqlite3.OperationalError("database is locked"),
+    )
+    with locked as execute_many:
+        for i in range(3):
+            writer.save(Event(kind="click", value=i))
+        writer.flush()
+
+    # One attempt plus one retry, without falling back to row-by-row inserts.
+    assert execute_many.call_count == 2
+    assert writer.rows_failed == 3
+    assert writer.errors == 1